@@ -1,10 +1,16 @@
 use pyo3::prelude::*;
-use pyo3::types::{PyModule, PyList};
+use pyo3::types::{PyBytes, PyModule, PyList, PyString};
 use pyo3::wrap_pyfunction;
-use skia_safe::{Paint, Color, surfaces, EncodedImageFormat, Image, Font, Data, FontMgr, Point};
+use rayon::prelude::*;
+use memchr::{memchr, memmem};
+use skia_safe::{Canvas, Paint, Color, surfaces, Image, Font, Data, FontMgr, Point, Typeface};
+use skia_safe::{AlphaType, ColorType, ImageInfo};
 use skia_safe::canvas::SrcRectConstraint;
+use std::cell::{OnceCell, RefCell};
 use std::fs::File;
 use std::io::Write;
+use std::path::{Path, PathBuf};
+use std::sync::mpsc;
 
 // Import sgfmill module at initialization
 static SGFMILL: pyo3::once_cell::GILOnceCell<Py<PyModule>> = pyo3::once_cell::GILOnceCell::new();
@@ -32,6 +38,67 @@ struct BoardSize {
     height: usize,
 }
 
+// Board cell values, stored row by row from the top-left corner
+const EMPTY: u8 = 0;
+const BLACK: u8 = 1;
+const WHITE: u8 = 2;
+
+/// Indices of the points orthogonally adjacent to `point`.
+fn neighbours(point: usize, width: usize, height: usize) -> impl Iterator<Item = usize> {
+    let (x, y) = (point % width, point / width);
+    [
+        (x > 0).then(|| point - 1),
+        (x + 1 < width).then(|| point + 1),
+        (y > 0).then(|| point - width),
+        (y + 1 < height).then(|| point + width),
+    ]
+    .into_iter()
+    .flatten()
+}
+
+/// Remove the group containing `point` from the board if it has no liberties.
+fn remove_if_captured(board: &mut [u8], width: usize, height: usize, point: usize) {
+    let color = board[point];
+    let mut seen = vec![false; board.len()];
+    let mut group = vec![point];
+    seen[point] = true;
+
+    let mut i = 0;
+    while i < group.len() {
+        for next in neighbours(group[i], width, height) {
+            if board[next] == EMPTY {
+                return;
+            }
+            if board[next] == color && !seen[next] {
+                seen[next] = true;
+                group.push(next);
+            }
+        }
+        i += 1;
+    }
+
+    for stone in group {
+        board[stone] = EMPTY;
+    }
+}
+
+/// Place a stone and resolve captures, including suicide of the played group.
+fn play_move(board: &mut [u8], width: usize, height: usize, mv: &Move) {
+    if mv.x >= width || mv.y >= height {
+        return;
+    }
+    let point = mv.y * width + mv.x;
+    let color = if mv.color == 'B' { BLACK } else { WHITE };
+    board[point] = color;
+
+    for next in neighbours(point, width, height) {
+        if board[next] != EMPTY && board[next] != color {
+            remove_if_captured(board, width, height, next);
+        }
+    }
+    remove_if_captured(board, width, height, point);
+}
+
 /// Parse board size from SGF content, handling both square and rectangular boards.
 /// Returns a BoardSize struct with the parsed dimensions.
 /// 
@@ -41,21 +108,21 @@ struct BoardSize {
 /// # Examples
 /// ```
 /// // Square board: SZ[19]
-/// let size = parse_board_size("(;SZ[19])").unwrap();
+/// let size = parse_board_size(b"(;SZ[19])").unwrap();
 /// assert_eq!(size.width, 19);
 /// assert_eq!(size.height, 19);
 /// 
 /// // Rectangular board: SZ[15:10]
-/// let size = parse_board_size("(;SZ[15:10])").unwrap();
+/// let size = parse_board_size(b"(;SZ[15:10])").unwrap();
 /// assert_eq!(size.width, 15);
 /// assert_eq!(size.height, 10);
 /// ```
-fn parse_board_size(sgf_content: &str) -> PyResult<BoardSize> {
+fn parse_board_size(sgf_content: &[u8]) -> PyResult<BoardSize> {
     // Extract size value from SZ property
-    let sz_value = if let Some(sz_start) = sgf_content.find("SZ[") {
+    let sz_value = if let Some(sz_start) = memmem::find(sgf_content, b"SZ[") {
         let sz_content = &sgf_content[sz_start + 3..];
-        if let Some(sz_end) = sz_content.find(']') {
-            sz_content[..sz_end].to_string()
+        if let Some(sz_end) = memchr(b']', sz_content) {
+            String::from_utf8_lossy(&sz_content[..sz_end]).into_owned()
         } else {
             return Ok(BoardSize { width: 19, height: 19 }); // Default if malformed
         }
@@ -103,39 +170,149 @@ fn parse_board_size(sgf_content: &str) -> PyResult<BoardSize> {
     }
 }
 
-fn get_board_position(py: Python, sgf_content: &str, move_number: Option<usize>) -> PyResult<(BoardSize, Vec<Move>)> {
+/// A game parsed once from SGF, reusable across any number of renders.
+///
+/// Besides the moves, the board after every node of the main sequence is kept,
+/// so rendering any move number is a lookup rather than a replay of the game.
+/// A 19x19 game of 300 moves needs about 110 KB of snapshots.
+#[pyclass]
+struct ParsedSgf {
+    board_size: BoardSize,
+    moves: Vec<Move>,
+    // Board after the first `n` nodes, for every n, concatenated
+    snapshots: Vec<u8>,
+}
+
+impl ParsedSgf {
+    fn new(board_size: BoardSize, moves: Vec<Move>, total_nodes: usize) -> Self {
+        let (width, height) = (board_size.width, board_size.height);
+        let mut board = vec![EMPTY; width * height];
+        let mut snapshots = Vec::with_capacity(board.len() * (total_nodes + 1));
+        snapshots.extend_from_slice(&board);
+
+        let mut pending = moves.iter().peekable();
+        for node in 0..total_nodes {
+            while let Some(mv) = pending.next_if(|mv| mv.move_number == node) {
+                play_move(&mut board, width, height, mv);
+            }
+            snapshots.extend_from_slice(&board);
+        }
+
+        ParsedSgf { board_size, moves, snapshots }
+    }
+
+    /// The board after the first `move_number` nodes, or the final board.
+    fn board_at(&self, move_number: Option<usize>) -> &[u8] {
+        let area = self.board_size.width * self.board_size.height;
+        let last = self.snapshots.len() / area - 1;
+        let index = move_number.map_or(last, |n| n.min(last));
+        &self.snapshots[index * area..(index + 1) * area]
+    }
+
+    /// The stones to draw: numbered moves in kifu mode, otherwise the board position.
+    fn stones(&self, kifu: bool, move_number: Option<usize>) -> Stones<'_> {
+        if kifu {
+            Stones::Kifu(moves_up_to(&self.moves, move_number))
+        } else {
+            Stones::Board(self.board_at(move_number))
+        }
+    }
+}
+
+#[pymethods]
+impl ParsedSgf {
+    /// Number of nodes in the main sequence, i.e. the largest useful `move_number`.
+    fn __len__(&self) -> usize {
+        self.snapshots.len() / (self.board_size.width * self.board_size.height) - 1
+    }
+}
+
+/// Stones drawn by `render_position`.
+enum Stones<'a> {
+    /// Every move played, labelled with its number; captured stones stay visible
+    Kifu(&'a [Move]),
+    /// The stones standing on the board, one cell per point
+    Board(&'a [u8]),
+}
+
+/// Raw SGF content: `bytes`, read without decoding, or `str`.
+///
+/// sgfmill parses from a `bytes` object, so `str` content is encoded into one.
+/// Other buffer types are not accepted: the buffer protocol is not part of the
+/// abi3 limited API this extension is built against (before Python 3.11).
+#[derive(FromPyObject)]
+enum SgfSource<'a> {
+    Bytes(&'a PyBytes),
+    Text(&'a str),
+}
+
+impl SgfSource<'_> {
+    fn as_bytes(&self) -> &[u8] {
+        match self {
+            SgfSource::Bytes(bytes) => bytes.as_bytes(),
+            SgfSource::Text(text) => text.as_bytes(),
+        }
+    }
+
+    /// The content as a Python `bytes` object, if it already is one.
+    fn as_py_bytes(&self) -> Option<&PyBytes> {
+        match self {
+            SgfSource::Bytes(bytes) => Some(bytes),
+            _ => None,
+        }
+    }
+}
+
+/// SGF input accepted by the render functions: raw SGF content or a `ParsedSgf`.
+#[derive(FromPyObject)]
+enum SgfInput<'a> {
+    Parsed(PyRef<'a, ParsedSgf>),
+    Source(SgfSource<'a>),
+}
+
+impl SgfInput<'_> {
+    /// Run `f` on the parsed game, parsing the SGF content first if needed.
+    fn with_parsed<R>(self, py: Python, f: impl FnOnce(&ParsedSgf) -> PyResult<R>) -> PyResult<R> {
+        match self {
+            SgfInput::Parsed(parsed) => f(&parsed),
+            SgfInput::Source(source) => f(&get_board_position(py, source.as_bytes(), source.as_py_bytes())?),
+        }
+    }
+}
+
+/// Parse `sgf_content` into a `ParsedSgf`.
+///
+/// `sgf_bytes` is the `bytes` object the content was read from, if any. sgfmill is
+/// handed that object as it is unless the board size has to be rewritten; otherwise
+/// the content is copied into a new `bytes` object for it.
+fn get_board_position(py: Python, sgf_content: &[u8], sgf_bytes: Option<&PyBytes>) -> PyResult<ParsedSgf> {
     // Parse board size using our custom parser
     let board_size = parse_board_size(sgf_content)?;
 
-    // Create a modified SGF with square board size for sgfmill
+    // sgfmill only supports square boards: give rectangular ones a square size
     let max_size = board_size.width.max(board_size.height);
-    let modified_sgf = if let Some(sz_start) = sgf_content.find("SZ[") {
-        if let Some(sz_end) = sgf_content[sz_start..].find(']') {
+    let sz_span = memmem::find(sgf_content, b"SZ[")
+        .and_then(|sz_start| memchr(b']', &sgf_content[sz_start..]).map(|sz_end| (sz_start, sz_start + sz_end + 1)));
+    let modified_sgf = match (sz_span, sgf_bytes) {
+        (Some((sz_start, sz_end)), _) if board_size.width != board_size.height => {
             let before = &sgf_content[..sz_start];
-            let after = &sgf_content[sz_start + sz_end + 1..];
-            format!("{}SZ[{}]{}", before, max_size, after)
-        } else {
-            sgf_content.to_string()
+            let after = &sgf_content[sz_end..];
+            PyBytes::new(py, &[before, format!("SZ[{}]", max_size).as_bytes(), after].concat())
         }
-    } else {
-        sgf_content.to_string()
+        (_, Some(bytes)) => bytes,
+        _ => PyBytes::new(py, sgf_content),
     };
 
     // Use sgfmill only for parsing moves, with a square board
     let sgfmill = get_sgfmill(py)?;
-    let sgf_game = sgfmill.getattr("Sgf_game")?.call_method1("from_string", (modified_sgf,))?;
+    let sgf_game = sgfmill.getattr("Sgf_game")?.call_method1("from_bytes", (modified_sgf,))?;
     
     // Get the main sequence of moves
     let main_sequence = sgf_game.getattr("get_main_sequence")?.call0()?.downcast::<PyList>()?;
     let total_moves = main_sequence.len();
-    let moves_to_process = move_number.unwrap_or(total_moves);
     
     let mut moves = Vec::new();
-    for i in 0..moves_to_process {
-        if i >= total_moves {
-            break;
-        }
-        
+    for i in 0..total_moves {
         let node = main_sequence.get_item(i)?;
         let get_move = node.getattr("get_move")?;
         if let Ok(color_move) = get_move.call0()?.extract::<(Option<&str>, Option<(usize, usize)>)>() {
@@ -150,195 +327,851 @@ fn get_board_position(py: Python, sgf_content: &str, move_number: Option<usize>)
         }
     }
     
-    Ok((board_size, moves))
+    Ok(ParsedSgf::new(board_size, moves, total_moves))
 }
 
-#[pyfunction]
-#[pyo3(signature = (sgf_content, output_path, theme="dark", kifu=false, move_number=None))]
-fn render_sgf(sgf_content: &str, output_path: &str, theme: &str, kifu: bool, move_number: Option<usize>) -> PyResult<()> {
-    Python::with_gil(|py| {
-        // Parse board position using sgfmill
-        let (board_size, moves) = get_board_position(py, sgf_content, move_number)?;
-        let board_width = board_size.width;
-        let board_height = board_size.height;
-        let canvas_width = 800;
-        let canvas_height = 800;
-        
-        // Calculate cell size based on board dimensions and desired padding
-        let max_board_dim = board_width.max(board_height) as f32 - 1.0;
-        let cell_size = (canvas_width.min(canvas_height) as f32) / (max_board_dim + 3.0); // Add 3.0 for 1.5 cells padding on each side
-        let margin_x = (canvas_width as f32 - (cell_size * (board_width as f32 - 1.0))) / 2.0;
-        let margin_y = (canvas_height as f32 - (cell_size * (board_height as f32 - 1.0))) / 2.0;
-        
-        // Create surface
-        let mut surface = surfaces::raster_n32_premul((canvas_width, canvas_height))
-            .ok_or_else(|| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>("Failed to create surface"))?;
-
-        let canvas = surface.canvas();
-
-        // Set background based on theme
-        match theme {
-            "dark" => {
-                let data = Data::new_copy(include_bytes!("dark_board.png"));
-                if let Some(img) = Image::from_encoded(data) {
-                    canvas.draw_image(&img, (0, 0), None);
-                }
+type RenderFn = fn(&RenderAssets, &BoardSize, Stones<'_>, usize, PngOptions) -> PyResult<Vec<u8>>;
+
+struct ThemeDef {
+    name: &'static str,
+    /// Board texture, or `None` for a plain white background
+    board: Option<&'static [u8]>,
+    /// `render_png_with` instantiated for the theme's stone style
+    render: RenderFn,
+    /// Only gray tones are drawn, so the image fits an 8-bit grayscale PNG losslessly
+    grayscale: bool,
+}
+
+/// Themes, indexed by the integer Python passes (the values of its `Theme` enum).
+static THEMES: [ThemeDef; 3] = [
+    ThemeDef {
+        name: "light",
+        board: Some(include_bytes!("light_board.png")),
+        render: render_png_with::<GlassStones>,
+        grayscale: false,
+    },
+    ThemeDef {
+        name: "dark",
+        board: Some(include_bytes!("dark_board.png")),
+        render: render_png_with::<GlassStones>,
+        grayscale: false,
+    },
+    ThemeDef {
+        name: "paper",
+        board: None,
+        render: render_png_with::<FlatStones>,
+        grayscale: true,
+    },
+];
+const DARK: usize = 1;
+
+/// Extract a theme index into `THEMES` from an int such as a `Theme` member, or from a theme name.
+fn extract_theme(obj: &PyAny) -> PyResult<usize> {
+    if let Ok(name) = obj.downcast::<PyString>() {
+        let name = name.to_str()?;
+        return THEMES.iter().position(|theme| theme.name == name).ok_or_else(|| {
+            PyErr::new::<pyo3::exceptions::PyValueError, _>(format!("Unknown theme: {}", name))
+        });
+    }
+    match obj.extract::<usize>()? {
+        index if index < THEMES.len() => Ok(index),
+        _ => Err(PyErr::new::<pyo3::exceptions::PyValueError, _>("Unknown theme")),
+    }
+}
+
+thread_local! {
+    // Assets decoded by this thread, kept for its later renders
+    static ASSETS: OnceCell<RenderAssets> = OnceCell::new();
+}
+
+/// Images and typeface used for rendering, decoded once per thread (see `RenderAssets::with`).
+struct RenderAssets {
+    typeface: Typeface,
+    // Board textures, indexed like `THEMES` and decoded the first time their theme is drawn
+    boards: [OnceCell<Option<Image>>; 3],
+    black_stone: Option<Image>,
+    white_stone: Option<Image>,
+}
+
+impl RenderAssets {
+    fn load() -> PyResult<Self> {
+        let font_data = Data::new_copy(include_bytes!("Oswald-VariableFont_wght.ttf"));
+        let typeface = FontMgr::new()
+            .new_from_data(font_data.as_bytes(), 0)
+            .ok_or_else(|| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>("Failed to load font"))?;
+
+        Ok(RenderAssets {
+            typeface,
+            boards: Default::default(),
+            black_stone: Image::from_encoded(Data::new_copy(include_bytes!("black_glass_stone.png"))),
+            white_stone: Image::from_encoded(Data::new_copy(include_bytes!("white_glass_stone.png"))),
+        })
+    }
+
+    /// Run `f` with this thread's assets, loading them on the thread's first render.
+    ///
+    /// Skia images and typefaces cannot be shared across threads, so each thread,
+    /// rayon workers included, keeps its own copy for as long as it lives.
+    fn with<R>(f: impl FnOnce(&RenderAssets) -> PyResult<R>) -> PyResult<R> {
+        ASSETS.with(|assets| {
+            if assets.get().is_none() {
+                let _ = assets.set(RenderAssets::load()?);
             }
-            "light" => {
-                let data = Data::new_copy(include_bytes!("light_board.png"));
-                if let Some(img) = Image::from_encoded(data) {
-                    canvas.draw_image(&img, (0, 0), None);
-                }
+            f(assets.get().unwrap())
+        })
+    }
+
+    /// The board texture of `theme`, or `None` for a plain white background.
+    fn board(&self, theme: usize) -> Option<&Image> {
+        self.boards[theme]
+            .get_or_init(|| THEMES[theme].board.and_then(|bytes| Image::from_encoded(Data::new_copy(bytes))))
+            .as_ref()
+    }
+}
+
+/// Extract an output path from `bytes` (as returned by `os.fsencode`), `str` or `os.PathLike`.
+///
+/// Bytes are taken as-is, skipping the UTF-8 round trip a `str` path goes through.
+fn extract_path(obj: &PyAny) -> PyResult<PathBuf> {
+    match obj.downcast::<PyBytes>() {
+        Ok(bytes) => path_from_bytes(bytes.as_bytes()),
+        Err(_) => obj.extract(),
+    }
+}
+
+#[cfg(unix)]
+fn path_from_bytes(bytes: &[u8]) -> PyResult<PathBuf> {
+    use std::os::unix::ffi::OsStrExt;
+    Ok(PathBuf::from(std::ffi::OsStr::from_bytes(bytes)))
+}
+
+#[cfg(not(unix))]
+fn path_from_bytes(bytes: &[u8]) -> PyResult<PathBuf> {
+    // os.fsencode encodes paths as UTF-8 on Windows
+    std::str::from_utf8(bytes)
+        .map(PathBuf::from)
+        .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))
+}
+
+/// Extract a sequence of paths, each accepted in any of the forms `extract_path` takes.
+///
+/// A lone `str` or `bytes` is rejected rather than iterated as one path per character.
+fn extract_paths(obj: &PyAny) -> PyResult<Vec<PathBuf>> {
+    if obj.is_instance_of::<PyString>() || obj.is_instance_of::<PyBytes>() {
+        return Err(PyErr::new::<pyo3::exceptions::PyTypeError, _>(
+            "Expected a sequence of paths, got a single str or bytes path"
+        ));
+    }
+    obj.iter()?.map(|item| extract_path(item?)).collect()
+}
+
+/// How rendered images are encoded as PNG.
+#[derive(Clone, Copy)]
+struct PngOptions {
+    /// Write an 8-bit single-channel image for themes drawn only in gray tones (paper).
+    /// Other themes ignore it.
+    grayscale: bool,
+    /// zlib-style compression level, 0 (fastest) to 9 (smallest), applied in the
+    /// three tiers of `png_compression`
+    compression: u8,
+}
+
+impl PngOptions {
+    fn new(grayscale: bool, compression: u8) -> PyResult<Self> {
+        if compression > 9 {
+            return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
+                "Compression level must be between 0 and 9"
+            ));
+        }
+        Ok(PngOptions { grayscale, compression })
+    }
+
+    /// The png crate only offers three levels: 0-2 map to fast, 3-6 to default, 7-9 to best.
+    fn png_compression(&self) -> png::Compression {
+        match self.compression {
+            0..=2 => png::Compression::Fast,
+            3..=6 => png::Compression::Default,
+            _ => png::Compression::Best,
+        }
+    }
+}
+
+/// One output image requested through `render_sgf_batch`.
+struct RenderJob {
+    output_path: PathBuf,
+    theme: usize,
+    kifu: bool,
+    move_number: Option<usize>,
+    encoding: PngOptions,
+}
+
+/// Look up `key` in a job mapping, treating a missing key as `None`.
+fn job_item<'a>(job: &'a PyAny, key: &str) -> PyResult<Option<&'a PyAny>> {
+    match job.get_item(key) {
+        Ok(value) => Ok(Some(value)),
+        Err(err) if err.is_instance_of::<pyo3::exceptions::PyKeyError>(job.py()) => Ok(None),
+        Err(err) => Err(err),
+    }
+}
+
+impl<'a> FromPyObject<'a> for RenderJob {
+    /// Extract a job from a mapping. Only `output_path` is required; the other keys
+    /// default like the `render_sgf` arguments of the same name.
+    fn extract(job: &'a PyAny) -> PyResult<Self> {
+        Ok(RenderJob {
+            output_path: extract_path(job.get_item("output_path")?)?,
+            theme: job_item(job, "theme")?.map_or(Ok(DARK), extract_theme)?,
+            kifu: job_item(job, "kifu")?.map_or(Ok(false), |value| value.extract())?,
+            move_number: job_item(job, "move_number")?.map_or(Ok(None), |value| value.extract())?,
+            encoding: PngOptions::new(
+                job_item(job, "grayscale")?.map_or(Ok(true), |value| value.extract())?,
+                job_item(job, "compression")?.map_or(Ok(6), |value| value.extract())?,
+            )?,
+        })
+    }
+}
+
+/// Return the moves played within the first `move_number` nodes of the main sequence.
+fn moves_up_to(moves: &[Move], move_number: Option<usize>) -> &[Move] {
+    match move_number {
+        Some(limit) => &moves[..moves.partition_point(|mv| mv.move_number < limit)],
+        None => moves,
+    }
+}
+
+/// How a theme draws its stones. Rendering is monomorphized per style (see
+/// `ThemeDef::render`), so the stone loop carries no per-stone theme checks.
+trait StoneStyle {
+    fn draw_stone(canvas: &Canvas, assets: &RenderAssets, center: (f32, f32), stone_size: f32, color: char);
+}
+
+/// Plain black and white circles
+struct FlatStones;
+
+impl StoneStyle for FlatStones {
+    fn draw_stone(canvas: &Canvas, _assets: &RenderAssets, (cx, cy): (f32, f32), stone_size: f32, color: char) {
+        let mut stone_paint = Paint::default();
+        stone_paint.set_anti_alias(true);
+
+        match color {
+            'B' => {
+                stone_paint.set_color(Color::BLACK);
+                canvas.draw_circle((cx, cy), stone_size, &stone_paint);
             }
-            _ => {
-                canvas.clear(Color::WHITE);
+            'W' => {
+                stone_paint.set_color(Color::WHITE);
+                stone_paint.set_style(skia_safe::paint::Style::Fill);
+                canvas.draw_circle((cx, cy), stone_size, &stone_paint);
+
+                stone_paint.set_color(Color::BLACK);
+                stone_paint.set_style(skia_safe::paint::Style::Stroke);
+                stone_paint.set_stroke_width(1.0);
+                canvas.draw_circle((cx, cy), stone_size, &stone_paint);
             }
+            _ => {}
+        }
+    }
+}
+
+/// Glass stone images
+struct GlassStones;
+
+impl StoneStyle for GlassStones {
+    fn draw_stone(canvas: &Canvas, assets: &RenderAssets, (cx, cy): (f32, f32), stone_size: f32, color: char) {
+        let stone_img = match color {
+            'B' => assets.black_stone.as_ref(),
+            'W' => assets.white_stone.as_ref(),
+            _ => None,
         };
 
-        // Draw grid
-        let mut paint = Paint::default();
-        paint.set_anti_alias(true);
-
-        // Draw horizontal lines
-        for i in 0..board_height {
-            let y = margin_y + i as f32 * cell_size;
-            canvas.draw_line(
-                (margin_x, y),
-                (margin_x + (board_width as f32 - 1.0) * cell_size, y),
-                &paint
+        if let Some(stone_img) = stone_img {
+            // Define source rect to flip the image 180 degrees
+            let src_rect = skia_safe::Rect::from_xywh(0.0, 0.0, stone_img.width() as f32, stone_img.height() as f32);
+            let dst_rect = skia_safe::Rect::from_xywh(
+                cx - stone_size,
+                cy - stone_size,
+                stone_size * 2.0,
+                stone_size * 2.0
             );
-        }
 
-        // Draw vertical lines
-        for i in 0..board_width {
-            let x = margin_x + i as f32 * cell_size;
-            canvas.draw_line(
-                (x, margin_y),
-                (x, margin_y + (board_height as f32 - 1.0) * cell_size),
-                &paint
+            let mut paint = Paint::default();
+            paint.set_anti_alias(true);
+
+            canvas.save();
+            canvas.draw_image_rect(
+                stone_img,
+                Some((&src_rect, SrcRectConstraint::Fast)),
+                dst_rect,
+                &paint,
             );
+            canvas.restore();
         }
+    }
+}
+
+fn draw_move_number(canvas: &Canvas, font: &Font, (cx, cy): (f32, f32), mv: &Move) {
+    let text = mv.move_number.to_string();
+
+    let mut outline_paint = Paint::default();
+    outline_paint.set_style(skia_safe::paint::Style::Stroke);
+    outline_paint.set_stroke_width(3.0);
+    outline_paint.set_anti_alias(true);
+    outline_paint.set_color(if mv.color == 'B' { Color::BLACK } else { Color::WHITE });
+
+    let mut fill_paint = Paint::default();
+    fill_paint.set_style(skia_safe::paint::Style::Fill);
+    fill_paint.set_anti_alias(true);
+    fill_paint.set_color(if mv.color == 'B' { Color::WHITE } else { Color::BLACK });
+
+    let text_blob = skia_safe::TextBlob::new(&text, font).unwrap();
+    let text_bounds = text_blob.bounds();
+    let text_x = text_bounds.width() / 2.0;
+    let text_y = text_bounds.height() / 4.0;
+
+    canvas.draw_text_blob(&text_blob, (cx - text_x, cy + text_y), &outline_paint);
+    canvas.draw_text_blob(&text_blob, (cx - text_x, cy + text_y), &fill_paint);
+}
+
+/// Draw a position and encode it as PNG, with the renderer specialised for the theme.
+fn render_png(
+    assets: &RenderAssets,
+    board_size: &BoardSize,
+    stones: Stones,
+    theme: usize,
+    encoding: PngOptions,
+) -> PyResult<Vec<u8>> {
+    (THEMES[theme].render)(assets, board_size, stones, theme, encoding)
+}
+
+thread_local! {
+    // Pixel buffers of finished renders, kept for the next render on the same thread
+    static FB_POOL: RefCell<Vec<Vec<u8>>> = RefCell::new(Vec::new());
+}
+
+/// Take a buffer of `len` bytes from this thread's pool, allocating only when the
+/// pool is empty or its buffer is too small. The contents are left unspecified.
+fn take_framebuffer(len: usize) -> Vec<u8> {
+    let mut buffer = FB_POOL.with(|pool| pool.borrow_mut().pop()).unwrap_or_default();
+    buffer.resize(len, 0);
+    buffer
+}
+
+/// Return a buffer from `take_framebuffer` to this thread's pool.
+fn recycle_framebuffer(buffer: Vec<u8>) {
+    FB_POOL.with(|pool| pool.borrow_mut().push(buffer));
+}
+
+fn render_png_with<S: StoneStyle>(
+    assets: &RenderAssets,
+    board_size: &BoardSize,
+    stones: Stones,
+    theme: usize,
+    encoding: PngOptions,
+) -> PyResult<Vec<u8>> {
+    let board_width = board_size.width;
+    let board_height = board_size.height;
+    let canvas_width = 800;
+    let canvas_height = 800;
+
+    // Calculate cell size based on board dimensions and desired padding
+    let max_board_dim = board_width.max(board_height) as f32 - 1.0;
+    let cell_size = (canvas_width.min(canvas_height) as f32) / (max_board_dim + 3.0); // Add 3.0 for 1.5 cells padding on each side
+    let margin_x = (canvas_width as f32 - (cell_size * (board_width as f32 - 1.0))) / 2.0;
+    let margin_y = (canvas_height as f32 - (cell_size * (board_height as f32 - 1.0))) / 2.0;
+
+    // Create surface over a pooled buffer, so batch renders reuse the same pixels
+    let info = ImageInfo::new((canvas_width, canvas_height), ColorType::RGBA8888, AlphaType::Premul, None);
+    let row_bytes = canvas_width as usize * 4;
+    let mut pixels = take_framebuffer(row_bytes * canvas_height as usize);
+    let mut surface = surfaces::wrap_pixels(&info, &mut pixels, row_bytes, None)
+        .ok_or_else(|| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>("Failed to create surface"))?;
 
-        // Draw star points (hoshi)
-        if board_width == 19 && board_height == 19 {
-            let star_points = [(3, 3), (3, 9), (3, 15),
-                             (9, 3), (9, 9), (9, 15),
-                             (15, 3), (15, 9), (15, 15)];
-            
-            paint.set_style(skia_safe::paint::Style::Fill);
-            for &(x, y) in &star_points {
-                let cx = margin_x + x as f32 * cell_size;
-                let cy = margin_y + y as f32 * cell_size;
-                canvas.draw_circle((cx, cy), 5.0, &paint);
+    let canvas = surface.canvas();
+
+    // Set background based on theme
+    match assets.board(theme) {
+        Some(img) => {
+            // The buffer still holds the previous render wherever the texture does not paint
+            if img.width() < canvas_width || img.height() < canvas_height || !img.is_opaque() {
+                canvas.clear(Color::TRANSPARENT);
             }
+            canvas.draw_image(img, (0, 0), None);
+        }
+        None => {
+            canvas.clear(Color::WHITE);
         }
+    };
+    let theme = &THEMES[theme];
 
-        // Load font for kifu rendering
-        let font_data = Data::new_copy(include_bytes!("Oswald-VariableFont_wght.ttf"));
-        let font_mgr = FontMgr::new();
-        let typeface = font_mgr.new_from_data(font_data.as_bytes(), 0).unwrap();
-        let font = Font::new(typeface, cell_size * 0.6);
-
-        // Draw stones and move numbers
-        for mv in &moves {
-            let cx = margin_x + mv.x as f32 * cell_size;
-            let cy = margin_y + mv.y as f32 * cell_size;
-            let stone_size = cell_size * 0.5;
-
-            if theme == "paper" {
-                let mut stone_paint = Paint::default();
-                stone_paint.set_anti_alias(true);
-                
-                match mv.color {
-                    'B' => {
-                        stone_paint.set_color(Color::BLACK);
-                        canvas.draw_circle((cx, cy), stone_size, &stone_paint);
-                    }
-                    'W' => {
-                        stone_paint.set_color(Color::WHITE);
-                        stone_paint.set_style(skia_safe::paint::Style::Fill);
-                        canvas.draw_circle((cx, cy), stone_size, &stone_paint);
-                        
-                        stone_paint.set_color(Color::BLACK);
-                        stone_paint.set_style(skia_safe::paint::Style::Stroke);
-                        stone_paint.set_stroke_width(1.0);
-                        canvas.draw_circle((cx, cy), stone_size, &stone_paint);
-                    }
-                    _ => continue,
-                }
-            } else {
-                let stone_data = match mv.color {
-                    'B' => Data::new_copy(include_bytes!("black_glass_stone.png")),
-                    'W' => Data::new_copy(include_bytes!("white_glass_stone.png")),
+    // Draw grid
+    let mut paint = Paint::default();
+    paint.set_anti_alias(true);
+
+    // Draw horizontal lines
+    for i in 0..board_height {
+        let y = margin_y + i as f32 * cell_size;
+        canvas.draw_line(
+            (margin_x, y),
+            (margin_x + (board_width as f32 - 1.0) * cell_size, y),
+            &paint
+        );
+    }
+
+    // Draw vertical lines
+    for i in 0..board_width {
+        let x = margin_x + i as f32 * cell_size;
+        canvas.draw_line(
+            (x, margin_y),
+            (x, margin_y + (board_height as f32 - 1.0) * cell_size),
+            &paint
+        );
+    }
+
+    // Draw star points (hoshi)
+    if board_width == 19 && board_height == 19 {
+        let star_points = [(3, 3), (3, 9), (3, 15),
+                         (9, 3), (9, 9), (9, 15),
+                         (15, 3), (15, 9), (15, 15)];
+
+        paint.set_style(skia_safe::paint::Style::Fill);
+        for &(x, y) in &star_points {
+            let cx = margin_x + x as f32 * cell_size;
+            let cy = margin_y + y as f32 * cell_size;
+            canvas.draw_circle((cx, cy), 5.0, &paint);
+        }
+    }
+
+    // Draw stones, and move numbers in kifu mode
+    let stone_size = cell_size * 0.5;
+    match stones {
+        Stones::Kifu(moves) => {
+            // Load font for kifu rendering
+            let font = Font::new(assets.typeface.clone(), cell_size * 0.6);
+
+            for mv in moves {
+                let cx = margin_x + mv.x as f32 * cell_size;
+                let cy = margin_y + mv.y as f32 * cell_size;
+                S::draw_stone(canvas, assets, (cx, cy), stone_size, mv.color);
+                draw_move_number(canvas, &font, (cx, cy), mv);
+            }
+        }
+        Stones::Board(board) => {
+            for (point, &cell) in board.iter().enumerate() {
+                let color = match cell {
+                    BLACK => 'B',
+                    WHITE => 'W',
                     _ => continue,
                 };
-                
-                if let Some(stone_img) = Image::from_encoded(stone_data) {
-                    // Define source rect to flip the image 180 degrees
-                    let src_rect = skia_safe::Rect::from_xywh(0.0, 0.0, stone_img.width() as f32, stone_img.height() as f32);
-                    let dst_rect = skia_safe::Rect::from_xywh(
-                        cx - stone_size,
-                        cy - stone_size,
-                        stone_size * 2.0,
-                        stone_size * 2.0
-                    );
-                    
-                    let mut paint = Paint::default();
-                    paint.set_anti_alias(true);
-                    
-                    canvas.save();
-                    canvas.draw_image_rect(
-                        &stone_img,
-                        Some((&src_rect, SrcRectConstraint::Fast)),
-                        dst_rect,
-                        &paint,
-                    );
-                    canvas.restore();
-                }
+                let cx = margin_x + (point % board_width) as f32 * cell_size;
+                let cy = margin_y + (point / board_width) as f32 * cell_size;
+                S::draw_stone(canvas, assets, (cx, cy), stone_size, color);
             }
+        }
+    }
+
+    // Encode image
+    drop(surface);
+    let png_data = encode_png(
+        &pixels,
+        (canvas_width as usize, canvas_height as usize),
+        encoding.grayscale && theme.grayscale,
+        encoding.png_compression(),
+    );
+    recycle_framebuffer(pixels);
+    png_data
+}
+
+fn encode_error(e: png::EncodingError) -> PyErr {
+    PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!("Failed to encode image: {}", e))
+}
 
-            // Draw move numbers if kifu mode is enabled
-            if kifu {
-                let text = mv.move_number.to_string();
-                
-                let mut outline_paint = Paint::default();
-                outline_paint.set_style(skia_safe::paint::Style::Stroke);
-                outline_paint.set_stroke_width(3.0);
-                outline_paint.set_anti_alias(true);
-                outline_paint.set_color(if mv.color == 'B' { Color::BLACK } else { Color::WHITE });
-                
-                let mut fill_paint = Paint::default();
-                fill_paint.set_style(skia_safe::paint::Style::Fill);
-                fill_paint.set_anti_alias(true);
-                fill_paint.set_color(if mv.color == 'B' { Color::WHITE } else { Color::BLACK });
-                
-                let text_blob = skia_safe::TextBlob::new(&text, &font).unwrap();
-                let text_bounds = text_blob.bounds();
-                let text_x = text_bounds.width() / 2.0;
-                let text_y = text_bounds.height() / 4.0;
-                
-                canvas.draw_text_blob(&text_blob, (cx - text_x, cy + text_y), &outline_paint);
-                canvas.draw_text_blob(&text_blob, (cx - text_x, cy + text_y), &fill_paint);
+/// Encode premultiplied RGBA pixels as PNG in the smallest pixel format that holds
+/// them without loss.
+///
+/// `grayscale` pixels hold only gray tones and are written with one byte per
+/// pixel, leaving deflate a quarter of the RGBA input. Compression goes through
+/// flate2, built with its zlib-ng backend.
+fn encode_png(
+    rgba: &[u8],
+    (width, height): (usize, usize),
+    grayscale: bool,
+    compression: png::Compression,
+) -> PyResult<Vec<u8>> {
+    let (color, channels) = if grayscale {
+        (png::ColorType::Grayscale, 1)
+    } else if rgba.chunks_exact(4).all(|pixel| pixel[3] == u8::MAX) {
+        (png::ColorType::Rgb, 3)
+    } else {
+        (png::ColorType::Rgba, 4)
+    };
+
+    let mut pixels = take_framebuffer(width * height * channels);
+    for (out, pixel) in pixels.chunks_exact_mut(channels).zip(rgba.chunks_exact(4)) {
+        match channels {
+            // Red, green and blue are equal in a gray pixel
+            1 => out[0] = pixel[0],
+            // Opaque pixels are the same premultiplied or not
+            3 => out.copy_from_slice(&pixel[..3]),
+            _ => {
+                let alpha = pixel[3] as u32;
+                for (out, &channel) in out.iter_mut().zip(&pixel[..3]) {
+                    *out = if alpha == 0 { 0 } else { ((channel as u32 * 255 + alpha / 2) / alpha).min(255) as u8 };
+                }
+                out[3] = pixel[3];
             }
         }
+    }
+
+    let png_data = write_png(&pixels, (width, height), color, compression);
+    recycle_framebuffer(pixels);
+    png_data
+}
+
+fn write_png(
+    pixels: &[u8],
+    (width, height): (usize, usize),
+    color: png::ColorType,
+    compression: png::Compression,
+) -> PyResult<Vec<u8>> {
+    let mut png_data = Vec::new();
+    let mut encoder = png::Encoder::new(&mut png_data, width as u32, height as u32);
+    encoder.set_color(color);
+    encoder.set_depth(png::BitDepth::Eight);
+    encoder.set_compression(compression);
+    let mut writer = encoder.write_header().map_err(encode_error)?;
+    writer.write_image_data(pixels).map_err(encode_error)?;
+    writer.finish().map_err(encode_error)?;
+    Ok(png_data)
+}
+
+/// Draw a position and save it as a PNG file.
+fn render_position(
+    assets: &RenderAssets,
+    board_size: &BoardSize,
+    stones: Stones,
+    theme: usize,
+    encoding: PngOptions,
+    output_path: &Path,
+) -> PyResult<()> {
+    let image_data = render_png(assets, board_size, stones, theme, encoding)?;
+
+    let mut file = File::create(output_path)
+        .map_err(|e| PyErr::new::<pyo3::exceptions::PyIOError, _>(e.to_string()))?;
+
+    file.write_all(&image_data)
+        .map_err(|e| PyErr::new::<pyo3::exceptions::PyIOError, _>(e.to_string()))?;
+
+    Ok(())
+}
 
-        // Save image
-        let image_data = surface.image_snapshot()
-            .encode_to_data(EncodedImageFormat::PNG)
-            .ok_or_else(|| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>("Failed to encode image"))?;
+#[pyfunction]
+#[pyo3(signature = (sgf_content, output_path, theme=DARK, kifu=false, move_number=None, grayscale=true, compression=6))]
+fn render_sgf(
+    py: Python,
+    sgf_content: SgfInput,
+    #[pyo3(from_py_with = "extract_path")] output_path: PathBuf,
+    #[pyo3(from_py_with = "extract_theme")] theme: usize,
+    kifu: bool,
+    move_number: Option<usize>,
+    grayscale: bool,
+    compression: u8,
+) -> PyResult<()> {
+    let encoding = PngOptions::new(grayscale, compression)?;
+    sgf_content.with_parsed(py, |parsed| py.allow_threads(|| RenderAssets::with(|assets| {
+        render_position(assets, &parsed.board_size, parsed.stones(kifu, move_number), theme, encoding, &output_path)
+    })))
+}
+
+/// Like `render_sgf`, but write the PNG to a file descriptor the caller has opened.
+///
+/// The image is written at offset 0 with positional writes and the file is then
+/// truncated to the image's length, so `fd` must refer to a regular file: pipes,
+/// sockets and terminals are rejected with `OSError`. It is left open and remains
+/// owned by the caller.
+#[cfg(unix)]
+#[pyfunction]
+#[pyo3(signature = (sgf_content, fd, theme=DARK, kifu=false, move_number=None, grayscale=true, compression=6))]
+fn render_sgf_to_fd(
+    py: Python,
+    sgf_content: SgfInput,
+    fd: std::os::unix::io::RawFd,
+    #[pyo3(from_py_with = "extract_theme")] theme: usize,
+    kifu: bool,
+    move_number: Option<usize>,
+    grayscale: bool,
+    compression: u8,
+) -> PyResult<()> {
+    use std::os::unix::fs::FileExt;
+    use std::os::unix::io::FromRawFd;
+
+    if fd < 0 {
+        return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>("Invalid file descriptor"));
+    }
+
+    let encoding = PngOptions::new(grayscale, compression)?;
+    sgf_content.with_parsed(py, |parsed| py.allow_threads(|| RenderAssets::with(|assets| {
+        let image_data = render_png(assets, &parsed.board_size, parsed.stones(kifu, move_number), theme, encoding)?;
+
+        // SAFETY: the caller keeps `fd` open during the call; ManuallyDrop leaves it open afterwards.
+        let file = std::mem::ManuallyDrop::new(unsafe { File::from_raw_fd(fd) });
+        file.write_all_at(&image_data, 0)
+            .and_then(|()| file.set_len(image_data.len() as u64))
+            .map_err(|e| PyErr::new::<pyo3::exceptions::PyIOError, _>(e.to_string()))
+    })))
+}
+
+/// Render a position given directly as a board, without any SGF.
+///
+/// `board` holds the cells of a (height, width) board given by `shape`, row by row
+/// from row 0 at the top: 0 (empty), 1 (black) or 2 (white). This is the same layout
+/// the SGF path renders its board snapshots from. A NumPy `uint8` array is passed
+/// as `bytes(array), array.shape`.
+#[pyfunction]
+#[pyo3(signature = (board, shape, output_path, theme=DARK, grayscale=true, compression=6))]
+fn render_board(
+    py: Python,
+    board: &[u8],
+    shape: (usize, usize),
+    #[pyo3(from_py_with = "extract_path")] output_path: PathBuf,
+    #[pyo3(from_py_with = "extract_theme")] theme: usize,
+    grayscale: bool,
+    compression: u8,
+) -> PyResult<()> {
+    let encoding = PngOptions::new(grayscale, compression)?;
+
+    let (height, width) = shape;
+    if width < 2 || width > 25 || height < 2 || height > 25 {
+        return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
+            "Board dimensions must be between 2 and 25"
+        ));
+    }
+    if board.len() != width * height {
+        return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
+            "Board must hold one byte per point of its shape"
+        ));
+    }
+    if board.iter().any(|&cell| cell > WHITE) {
+        return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
+            "Board cells must be 0 (empty), 1 (black) or 2 (white)"
+        ));
+    }
+
+    py.allow_threads(|| RenderAssets::with(|assets| {
+        render_position(assets, &BoardSize { width, height }, Stones::Board(board), theme, encoding, &output_path)
+    }))
+}
+
+/// Parse an SGF game once so it can be passed to `render_sgf` or `render_sgf_batch` repeatedly.
+#[pyfunction]
+fn parse_sgf(py: Python, sgf_content: SgfSource) -> PyResult<ParsedSgf> {
+    get_board_position(py, sgf_content.as_bytes(), sgf_content.as_py_bytes())
+}
+
+/// Render several views of one SGF game in a single call.
+///
+/// The SGF is parsed once, then the jobs are drawn in parallel from the shared
+/// move list with the GIL released.
+#[pyfunction]
+fn render_sgf_batch(py: Python, sgf_content: SgfInput, jobs: Vec<RenderJob>) -> PyResult<()> {
+    sgf_content.with_parsed(py, |parsed| py.allow_threads(|| {
+        render_in_parallel(&jobs, |assets, job| {
+            let stones = parsed.stones(job.kifu, job.move_number);
+            render_position(assets, &parsed.board_size, stones, job.theme, job.encoding, &job.output_path)
+        })
+    }))
+}
 
-        let mut file = File::create(output_path)
-            .map_err(|e| PyErr::new::<pyo3::exceptions::PyIOError, _>(e.to_string()))?;
-        
-        file.write_all(image_data.as_bytes())
-            .map_err(|e| PyErr::new::<pyo3::exceptions::PyIOError, _>(e.to_string()))?;
+/// Render the same view of many SGF files in a single call.
+///
+/// Reading, parsing and rendering overlap: files are read ahead on a separate
+/// thread, parsed one after the other by sgfmill on the calling thread (it needs
+/// the GIL), and each game is rendered on the rayon pool as soon as it is parsed.
+/// Bounded channels between the stages keep only a few games in memory at a time.
+#[pyfunction]
+#[pyo3(signature = (sgf_paths, output_paths, theme=DARK, kifu=false, move_number=None, grayscale=true, compression=6))]
+fn render_many(
+    py: Python,
+    #[pyo3(from_py_with = "extract_paths")] sgf_paths: Vec<PathBuf>,
+    #[pyo3(from_py_with = "extract_paths")] output_paths: Vec<PathBuf>,
+    #[pyo3(from_py_with = "extract_theme")] theme: usize,
+    kifu: bool,
+    move_number: Option<usize>,
+    grayscale: bool,
+    compression: u8,
+) -> PyResult<()> {
+    let encoding = PngOptions::new(grayscale, compression)?;
+    if sgf_paths.len() != output_paths.len() {
+        return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
+            "sgf_paths and output_paths must have the same length"
+        ));
+    }
+
+    let in_flight = rayon::current_num_threads();
+    let (content_sender, contents) = mpsc::sync_channel::<(Vec<u8>, &PathBuf)>(in_flight);
+    let (game_sender, games) = mpsc::sync_channel::<(ParsedSgf, &PathBuf)>(in_flight);
+    let (sgf_paths, output_paths) = (&sgf_paths, &output_paths);
+
+    std::thread::scope(|scope| {
+        // Not on the rayon pool: a reader blocked on a full channel must not hold a render worker
+        let reader = scope.spawn(move || -> PyResult<()> {
+            for (path, output_path) in sgf_paths.iter().zip(output_paths) {
+                let content = std::fs::read(path).map_err(|e| {
+                    PyErr::new::<pyo3::exceptions::PyIOError, _>(format!("{}: {}", path.display(), e))
+                })?;
+                if content_sender.send((content, output_path)).is_err() {
+                    break; // Parsing or rendering failed; its error is reported instead
+                }
+            }
+            Ok(())
+        });
 
-        Ok(())
+        let renderer = scope.spawn(move || {
+            games.into_iter().par_bridge().try_for_each(|(parsed, output_path)| {
+                RenderAssets::with(|assets| {
+                    render_position(assets, &parsed.board_size, parsed.stones(kifu, move_number), theme, encoding, output_path)
+                })
+            })
+        });
+
+        // Wait for each file without the GIL. A Receiver is not Sync, so it is moved
+        // into the closure and handed back rather than borrowed.
+        let mut contents = contents;
+        let mut parsed = Ok(());
+        loop {
+            let (receiver, next) = py.allow_threads(move || {
+                let next = contents.recv();
+                (contents, next)
+            });
+            contents = receiver;
+            let Ok((sgf_content, output_path)) = next else { break };
+            match get_board_position(py, &sgf_content, None) {
+                Ok(game) => {
+                    if py.allow_threads(|| game_sender.send((game, output_path))).is_err() {
+                        break; // Rendering failed; its error is reported below
+                    }
+                }
+                Err(e) => {
+                    parsed = Err(e);
+                    break;
+                }
+            }
+        }
+        // Hanging up unblocks a reader waiting on a full channel after an error
+        drop((contents, game_sender));
+
+        let (read, rendered) = py.allow_threads(move || (reader.join(), renderer.join()));
+        let (read, rendered) = match (read, rendered) {
+            (Ok(read), Ok(rendered)) => (read, rendered),
+            (Err(panic), _) | (_, Err(panic)) => std::panic::resume_unwind(panic),
+        };
+        rendered.and(parsed).and(read)
     })
 }
 
+/// Render `jobs` on the rayon pool. Skia objects are not shared between threads:
+/// each worker thread uses the assets it cached on its first render.
+fn render_in_parallel<T: Sync>(
+    jobs: &[T],
+    render: impl Fn(&RenderAssets, &T) -> PyResult<()> + Sync + Send,
+) -> PyResult<()> {
+    jobs.par_iter().try_for_each(|job| RenderAssets::with(|assets| render(assets, job)))
+}
+
 #[pymodule]
 fn rust_sgf_renderer(_py: Python, m: &PyModule) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(render_sgf, m)?)?;
+    m.add_function(wrap_pyfunction!(render_sgf_batch, m)?)?;
+    m.add_function(wrap_pyfunction!(render_many, m)?)?;
+    m.add_function(wrap_pyfunction!(render_board, m)?)?;
+    #[cfg(unix)]
+    m.add_function(wrap_pyfunction!(render_sgf_to_fd, m)?)?;
+    m.add_function(wrap_pyfunction!(parse_sgf, m)?)?;
+    m.add_class::<ParsedSgf>()?;
     Ok(())
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn mv(x: usize, y: usize, color: char, move_number: usize) -> Move {
+        Move { x, y, color, move_number }
+    }
+
+    /// Play `moves` in order on an empty 5x5 board.
+    fn play_all(moves: &[(usize, usize, char)]) -> Vec<u8> {
+        let mut board = vec![EMPTY; 25];
+        for (i, &(x, y, color)) in moves.iter().enumerate() {
+            play_move(&mut board, 5, 5, &mv(x, y, color, i));
+        }
+        board
+    }
+
+    #[test]
+    fn captures_single_stone() {
+        let board = play_all(&[(1, 1, 'W'), (0, 1, 'B'), (2, 1, 'B'), (1, 0, 'B'), (1, 2, 'B')]);
+        assert_eq!(board[5 + 1], EMPTY);
+        assert_eq!(board[5 * 2 + 1], BLACK);
+    }
+
+    #[test]
+    fn captures_group() {
+        let board = play_all(&[
+            (1, 1, 'W'), (2, 1, 'W'),
+            (0, 1, 'B'), (3, 1, 'B'), (1, 0, 'B'), (2, 0, 'B'), (1, 2, 'B'), (2, 2, 'B'),
+        ]);
+        assert_eq!(board[5 + 1], EMPTY);
+        assert_eq!(board[5 + 2], EMPTY);
+        assert_eq!(board.iter().filter(|&&cell| cell == BLACK).count(), 6);
+    }
+
+    #[test]
+    fn removes_suicide() {
+        let board = play_all(&[(1, 0, 'B'), (0, 1, 'B'), (0, 0, 'W')]);
+        assert_eq!(board[0], EMPTY);
+        assert_eq!(board[1], BLACK);
+        assert_eq!(board[5], BLACK);
+    }
+
+    #[test]
+    fn capture_prevents_suicide() {
+        // Black fills the last liberty of both white stones, which captures them first
+        let board = play_all(&[
+            (1, 0, 'W'), (0, 1, 'W'),
+            (2, 0, 'B'), (1, 1, 'B'), (0, 2, 'B'),
+            (0, 0, 'B'),
+        ]);
+        assert_eq!(board[0], BLACK);
+        assert_eq!(board[1], EMPTY);
+        assert_eq!(board[5], EMPTY);
+    }
+
+    fn parsed_game() -> ParsedSgf {
+        // Node 0 is the root; moves on nodes 1 and 3, a pass on node 2
+        let moves = vec![mv(2, 2, 'B', 1), mv(3, 3, 'W', 3)];
+        ParsedSgf::new(BoardSize { width: 5, height: 5 }, moves, 4)
+    }
+
+    #[test]
+    fn snapshots_follow_move_number() {
+        let game = parsed_game();
+        assert!(game.board_at(Some(0)).iter().all(|&cell| cell == EMPTY));
+        assert!(game.board_at(Some(1)).iter().all(|&cell| cell == EMPTY));
+        assert_eq!(game.board_at(Some(2))[5 * 2 + 2], BLACK);
+        assert_eq!(game.board_at(Some(3)), game.board_at(Some(2)));
+        assert_eq!(game.board_at(Some(4))[5 * 3 + 3], WHITE);
+    }
+
+    #[test]
+    fn move_number_past_end_clamps_to_last_snapshot() {
+        let game = parsed_game();
+        assert_eq!(game.board_at(Some(100)), game.board_at(None));
+        assert_eq!(game.board_at(Some(100)), game.board_at(Some(4)));
+    }
+
+    #[test]
+    fn len_counts_main_sequence_nodes() {
+        assert_eq!(parsed_game().__len__(), 4);
+        assert_eq!(ParsedSgf::new(BoardSize { width: 19, height: 19 }, Vec::new(), 0).__len__(), 0);
+    }
+}
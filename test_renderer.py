@@ -1,47 +1,242 @@
 import os
+from enum import IntEnum
+from pathlib import Path
+from typing import NamedTuple, Optional
 from rust_sgf_renderer import render_sgf as rust_render_sgf
+from rust_sgf_renderer import render_sgf_batch as rust_render_sgf_batch
+from rust_sgf_renderer import render_many as rust_render_many
+from rust_sgf_renderer import render_board as rust_render_board
+from rust_sgf_renderer import parse_sgf
+if os.name == "posix":
+    from rust_sgf_renderer import render_sgf_to_fd as rust_render_sgf_to_fd
 
-def render(sgf_path, **kwargs):
+class Theme(IntEnum):
+    """Rendering themes, passed to the Rust library as their integer value."""
+    LIGHT = 0
+    DARK = 1
+    PAPER = 2
+
+class RenderOpts(NamedTuple):
     """
-    Render an SGF file to a PNG image with a dynamically generated output filename.
+    Rendering options, built once and reused for every render call.
+
+    Attributes:
+        theme (Theme): Theme.LIGHT, Theme.DARK, or Theme.PAPER (default: Theme.DARK).
+        kifu (bool): Whether to show move numbers and keep all stones visible (default: False).
+        move (int, optional): If provided, renders the board state after this move number.
+                                     If not provided, renders the final board state.
+        grayscale (bool): Whether to save paper-theme images as 8-bit grayscale PNGs, which
+                          are smaller and faster to encode. Dark and light images are in
+                          color and are unaffected (default: True).
+        compression (int): PNG compression level from 0 (fastest) to 9 (smallest). The
+                           encoder has three tiers: 0-2 fast, 3-6 default and 7-9 best,
+                           so 0 does not write uncompressed output. Use 1 for previews
+                           that are only looked at once (default: 6).
+    """
+    theme: Theme = Theme.DARK
+    kifu: bool = False
+    move: Optional[int] = None
+    grayscale: bool = True
+    compression: int = 6
+
+DEFAULT_OPTS = RenderOpts()
+
+# Fast path for tight loops such as per-move animation frames: the Rust function itself,
+# called positionally as render_fast(sgf, output_path, theme, kifu, move_number, grayscale, compression),
+# where sgf is SGF bytes or a ParsedSgf, output_path is bytes/str, theme is a Theme and
+# move_number is the 1-based number of SGF nodes to play (None for the final position).
+render_fast = rust_render_sgf
+
+def rust_move_number(opts):
+    """
+    Convert opts.move to the move number expected by the Rust library.
 
     Args:
-        sgf_path (str): The file path of the SGF file to extract the base filename.
-        **kwargs: Optional arguments
-            theme (str): "light", "dark", or "paper" (default: "dark").
-            kifu (bool): Whether to show move numbers and keep all stones visible (default: False).
-            move (int, optional): If provided, renders the board state after this move number.
-                                         If not provided, renders the final board state.
-    """
-    theme = kwargs.get("theme", "dark")
-    kifu = kwargs.get("kifu", False)
-    move = kwargs.get("move")
-    if move is not None:
-        move += 1  # Convert to 1-based index for Rust
+        opts (RenderOpts): The rendering options.
 
-    # Extract filename from sgf_path
-    filename = os.path.splitext(os.path.basename(sgf_path))[0]
+    Returns:
+        int or None: The 1-based move number, or None for the final board state.
+    """
+    if opts.move is None:
+        return None
+    move = opts.move + 1  # Convert to 1-based index for Rust
+    return move if move >= 0 else None
+
+def output_target(stem, opts):
+    """
+    Work out the output filename and Rust-side move number for one view of an SGF file.
+
+    Args:
+        stem (str): The base filename of the SGF file, as returned by prepare().
+        opts (RenderOpts): The rendering options.
+
+    Returns:
+        tuple: The output path, encoded with os.fsencode, and the move number expected by
+               the Rust library.
+    """
+    move = rust_move_number(opts)
 
     # Determine output filename based on rendering options
-    output_path = f"{filename}_{theme}"
-    if kifu:
+    output_path = f"{stem}_{opts.theme.name.lower()}"
+    if opts.kifu:
         output_path += "_kifu"
     if move is not None:
-        if move < 0:
-            move = None
-        else:
-            output_path += f"_move{move-1}"  # Show original 0-based number in filename
+        output_path += f"_move{move-1}"  # Show original 0-based number in filename
 
     output_path += ".png"
 
-    # Read SGF content
-    with open(sgf_path, "r", encoding="utf-8") as file:
-        sgf_content = file.read()
+    return os.fsencode(output_path), move
+
+def load(sgf_path):
+    """
+    Read and parse an SGF file so it can be rendered several times.
+
+    The file is read as bytes, which are handed to sgfmill without further copies.
+
+    Args:
+        sgf_path (str): The file path of the SGF file.
+
+    Returns:
+        ParsedSgf: The parsed game, accepted wherever SGF content is.
+    """
+    return parse_sgf(Path(sgf_path).read_bytes())
+
+def prepare(sgf_path):
+    """
+    Do the per-file work of rendering once: parse the SGF file and extract its base filename.
+
+    Args:
+        sgf_path (str): The file path of the SGF file.
+
+    Returns:
+        tuple: The ParsedSgf and the base filename, to pass to render_one() and friends.
+    """
+    return load(sgf_path), Path(sgf_path).stem
+
+def render_one(parsed, stem, opts=DEFAULT_OPTS):
+    """
+    Render one view of a prepared SGF file to a PNG image named after the file and options.
+
+    Args:
+        parsed (ParsedSgf): The game, as returned by prepare().
+        stem (str): The base filename, as returned by prepare().
+        opts (RenderOpts, optional): The rendering options (default: RenderOpts()).
+    """
+    output_path, move_number = output_target(stem, opts)
 
     # Render SGF using Rust library
-    rust_render_sgf(sgf_content, output_path, theme=theme, kifu=kifu, move_number=move)
+    rust_render_sgf(parsed, output_path, opts.theme, opts.kifu, move_number, opts.grayscale, opts.compression)
+
+def render_one_to_fd(parsed, fd, opts=DEFAULT_OPTS):
+    """
+    Render one view of a prepared SGF file into an open file descriptor (POSIX only).
+
+    The descriptor must refer to a regular file, not a pipe or socket. It is written
+    from offset 0, truncated to the image's length and left open, e.g.:
+        fd = os.open("out.png", os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+
+    Args:
+        parsed (ParsedSgf): The game, as returned by prepare().
+        fd (int): A file descriptor open for writing.
+        opts (RenderOpts, optional): The rendering options (default: RenderOpts()).
+    """
+    rust_render_sgf_to_fd(parsed, fd, opts.theme, opts.kifu, rust_move_number(opts), opts.grayscale, opts.compression)
+
+def render(sgf_path, opts=DEFAULT_OPTS):
+    """
+    Render an SGF file to a PNG image with a dynamically generated output filename.
+
+    To render several views of one file, call prepare() once and render_one() for each view.
+
+    Args:
+        sgf_path (str): The file path of the SGF file to extract the base filename.
+        opts (RenderOpts, optional): The rendering options (default: RenderOpts()).
+    """
+    parsed, stem = prepare(sgf_path)
+    render_one(parsed, stem, opts)
+
+def render_batch(parsed, stem, views):
+    """
+    Render several views of a prepared SGF file with a single call into the Rust library.
+
+    Args:
+        parsed (ParsedSgf): The game, as returned by prepare().
+        stem (str): The base filename, as returned by prepare().
+        views (list of RenderOpts): The rendering options of each output image.
+    """
+    jobs = []
+    for opts in views:
+        output_path, move_number = output_target(stem, opts)
+        jobs.append({
+            "output_path": output_path,
+            "theme": opts.theme,
+            "kifu": opts.kifu,
+            "move_number": move_number,
+            "grayscale": opts.grayscale,
+            "compression": opts.compression,
+        })
+
+    rust_render_sgf_batch(parsed, jobs)
+
+def render_many(sgf_paths, opts=DEFAULT_OPTS):
+    """
+    Render the same view of many SGF files with a single call into the Rust library.
+
+    The files are read, parsed and rendered in an overlapping pipeline, with images
+    rendered in parallel. Each image is written next to its SGF file, so files of the
+    same name in different directories do not overwrite each other's output.
+
+    Args:
+        sgf_paths (iterable of str or Path): The SGF files to render.
+        opts (RenderOpts, optional): The rendering options (default: RenderOpts()).
+    """
+    if isinstance(sgf_paths, (str, bytes)):
+        raise TypeError("sgf_paths must be an iterable of paths, not a single path")
+    sgf_paths = list(sgf_paths)
+    output_paths = []
+    move_number = None
+    for sgf_path in sgf_paths:
+        output_path, move_number = output_target(str(Path(sgf_path).with_suffix("")), opts)
+        output_paths.append(output_path)
+
+    rust_render_many(sgf_paths, output_paths, opts.theme, opts.kifu, move_number, opts.grayscale, opts.compression)
+
+def render_frames(parsed, stem, opts=DEFAULT_OPTS):
+    """
+    Render one PNG image per move of a prepared SGF file, e.g. as frames of an animation.
+
+    Args:
+        parsed (ParsedSgf): The game, as returned by prepare().
+        stem (str): The base filename, as returned by prepare().
+        opts (RenderOpts, optional): The rendering options; opts.move is ignored.
+    """
+    prefix = f"{stem}_{opts.theme.name.lower()}{'_kifu' if opts.kifu else ''}_frame"
+    for move_number in range(1, len(parsed) + 1):
+        output_path = os.fsencode(f"{prefix}{move_number - 1:03d}.png")
+        render_fast(parsed, output_path, opts.theme, opts.kifu, move_number, opts.grayscale, opts.compression)
+
+def render_board(board, output_path, opts=DEFAULT_OPTS):
+    """
+    Render a board position held in memory, e.g. by a game engine, without going through SGF.
+
+    Args:
+        board: A 2-D uint8 array such as a NumPy array, of shape (height, width) with row 0
+               at the top, holding 0 (empty), 1 (black) or 2 (white) per point.
+        output_path (str or Path): The PNG file to write.
+        opts (RenderOpts, optional): The rendering options; only theme, grayscale and
+                                     compression apply (default: RenderOpts()).
+    """
+    # bytes() copies the cells in C order whatever the array's layout (at most 625 bytes)
+    rust_render_board(bytes(board), tuple(board.shape), os.fsencode(output_path), opts.theme, opts.grayscale, opts.compression)
 
 # Example usage
 if __name__ == "__main__":
     sgf_file_path = "game_2.sgf"
-    render(sgf_file_path)
+    parsed, stem = prepare(sgf_file_path)
+    render_one(parsed, stem, RenderOpts(theme=Theme.PAPER))
+    render_batch(parsed, stem, [
+        RenderOpts(kifu=True),
+        RenderOpts(),
+        RenderOpts(move=20),
+        RenderOpts(kifu=True, move=20, compression=1),
+    ])